@@ -1,3 +1,4 @@
 from .plugin import TestReportPlugin
+from .exporters import Exporter, HTMLExporter, JSONExporter, JUnitXMLExporter
 
 __version__ = '0.1.0'
@@ -1,22 +1,32 @@
 #!/usr/bin/env python
 
+import os
 import sys
 import pytest
 import argparse
 from .plugin import TestReportPlugin
+from .exporters import HTMLExporter, JSONExporter, JUnitXMLExporter
 
 def main():
     """Run tests and generate reports."""
     parser = argparse.ArgumentParser(description="Run tests and generate HTML/JSON reports")
     parser.add_argument("--test-files", nargs="*", help="Specific test files to run")
     parser.add_argument("--html", default="test_report.html", help="HTML report filename")
-    parser.add_argument("--json", default="test_report.json", help="JSON report filename")
+    parser.add_argument("--json", help="JSON report filename (default: test_report.json, or the updated report)")
+    parser.add_argument("--junit-xml", help="JUnit XML report filename")
     parser.add_argument("--title", default="Test Report", help="Report title")
+    parser.add_argument("--update-report", metavar="JSON",
+                        help="Rerun only the failed tests of an existing JSON report and patch it in place")
     
     args, pytest_args = parser.parse_known_args()
     
-    # Create the plugin instance
-    report_plugin = TestReportPlugin()
+    if args.update_report:
+        return update_report(args, pytest_args)
+    
+    # Create the plugin instance, reports are streamed while the tests run
+    report_plugin = TestReportPlugin(keep_results=False)
+    for exporter in create_exporters(args, args.json or "test_report.json"):
+        report_plugin.register_exporter(exporter)
     
     # Construct pytest args
     if args.test_files:
@@ -26,10 +36,72 @@ def main():
     print(f"Running tests: {' '.join(pytest_args)}")
     exit_code = pytest.main(pytest_args, plugins=[report_plugin])
     
+    print_summary(report_plugin)
+    
+    return exit_code
+
+def update_report(args, pytest_args):
+    """Rerun the failed tests of an existing report and update it."""
+    report_plugin = TestReportPlugin.from_json_report(args.update_report)
+    failed_tests = report_plugin.failed_tests()
+    exit_code = 0
+    
+    if not failed_tests:
+        print(f"No failed tests in {args.update_report}, nothing to rerun")
+    else:
+        # Test files are relative to the rootdir of the original run
+        rootdir = report_plugin.rootdir or os.getcwd()
+        if not any(arg.startswith("--rootdir") for arg in pytest_args):
+            pytest_args.append(f"--rootdir={rootdir}")
+        test_files = sorted({os.path.join(rootdir, test["file"]) for test in failed_tests})
+        test_files = [test_file for test_file in test_files if os.path.exists(test_file)]
+        
+        # Collect the files once to find the nodeids that still exist, so that
+        # renamed or deleted tests don't fail the run and pytest-xdist workers
+        # are handed exactly the tests to rerun
+        collect_plugin = TestReportPlugin()
+        collect_plugin.select_rerun(failed_tests)
+        if test_files:
+            pytest.main(pytest_args + test_files + ["--collect-only", "-qq"], plugins=[collect_plugin])
+        # Nodeid arguments are resolved against the current directory
+        nodeids = [os.path.join(rootdir, nodeid) for nodeid in collect_plugin.rerun_nodeids]
+        
+        replaced = set()
+        if nodeids:
+            rerun_plugin = TestReportPlugin()
+            rerun_plugin.select_rerun(failed_tests)
+            
+            print(f"Rerunning {len(nodeids)} failed tests from {args.update_report}")
+            exit_code = pytest.main(pytest_args + nodeids, plugins=[rerun_plugin])
+            
+            # Only patch the report if the rerun session actually ran tests
+            if rerun_plugin.test_results:
+                replaced = report_plugin.apply_rerun(rerun_plugin)
+        
+        missing_tests = [test for test in failed_tests
+                         if report_plugin._test_key(test) not in replaced]
+        if missing_tests:
+            print(f"Warning: {len(missing_tests)} failed tests from {args.update_report} "
+                  "were not rerun, keeping their previous results:")
+            for test in missing_tests:
+                print(f"  {test.get('nodeid') or test['file'] + '::' + test['name']}")
+    
     # Generate reports
-    report_plugin.generate_html_report(args.html)
-    report_plugin.generate_json_report(args.json)
+    report_plugin.export(*create_exporters(args, args.json or args.update_report))
     
+    print_summary(report_plugin)
+    
+    return exit_code
+
+def create_exporters(args, json_file):
+    """Create the exporters for the requested report formats."""
+    exporters = [HTMLExporter(args.html), JSONExporter(json_file)]
+    if args.junit_xml:
+        exporters.append(JUnitXMLExporter(args.junit_xml))
+    return exporters
+
+def print_summary(report_plugin):
+    """Print the summary counters of a report."""
     print("\nTest Summary:")
     print(f"Total: {report_plugin.summary['total']}")
     print(f"Passed: {report_plugin.summary['passed']}")
@@ -37,8 +109,6 @@ def main():
     print(f"Skipped: {report_plugin.summary['skipped']}")
     print(f"Error: {report_plugin.summary['error']}")
     print(f"Duration: {report_plugin.summary['duration']:.2f} seconds")
-    
-    return exit_code
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
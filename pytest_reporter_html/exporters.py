@@ -0,0 +1,1227 @@
+import json
+import os
+import re
+import shutil
+import socket
+import tempfile
+import textwrap
+from datetime import datetime
+from xml.sax.saxutils import XMLGenerator
+
+# Characters that are not allowed in XML 1.0 documents
+_ILLEGAL_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]")
+
+
+def _format_duration(duration):
+    """Format a percentile duration for the summary cards."""
+    return "-" if duration is None else f"{duration:.3f}"
+
+
+class _JSONArraySpool:
+    """Temporary file collecting a JSON array until it can be written out."""
+
+    def __init__(self, indent=""):
+        self._file = tempfile.TemporaryFile("w+", encoding="utf-8")
+        self._indent = indent
+        self._separator = "\n"
+
+    def write(self, item):
+        self._file.write(self._separator + self._indent)
+        self._file.write(json.dumps(item))
+        self._separator = ",\n"
+
+    def copy_to(self, f, closing_indent=""):
+        """Write the array to ``f`` and discard the spool."""
+        f.write("[")
+        self._file.seek(0)
+        shutil.copyfileobj(self._file, f)
+        self._file.close()
+        f.write("\n" + closing_indent + "]")
+
+
+class Exporter:
+    """Base class for report exporters.
+
+    Exporters subscribe to the plugin's stream of normalized test records:
+    ``start`` is called once before the first record, ``write_record`` once
+    per record as results arrive, and ``finish`` once the session is over.
+    Subclasses should write each record out as it arrives instead of keeping
+    it, so every exporter runs in constant memory.
+    """
+
+    def __init__(self, output_file):
+        self.output_file = output_file
+
+    def start(self, plugin):
+        """Called before the first test record."""
+
+    def write_record(self, record):
+        """Called with each test record as it arrives."""
+
+    def write_span(self, span):
+        """Called with each worker timeline span as it arrives."""
+
+    def finish(self, plugin):
+        """Called once all test records have been written."""
+
+
+class HTMLExporter(Exporter):
+    """Stream the interactive HTML report."""
+
+    def start(self, plugin):
+        # Test records are streamed into the testResults array of the template,
+        # everything after it needs the final summary and is written at the end
+        head, self._tail = _HTML_TEMPLATE.split("{test_results}")
+        self._file = open(self.output_file, "w")
+        self._file.write(head.format(datetime=datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+        self._file.write("[")
+        self._separator = "\n"
+        # Spans go after the test results in the report, so they wait in a spool
+        self._spans = _JSONArraySpool()
+
+    def write_record(self, record):
+        self._file.write(self._separator)
+        self._file.write(json.dumps(record))
+        self._separator = ",\n"
+
+    def write_span(self, span):
+        self._spans.write(span)
+
+    def finish(self, plugin):
+        summary = plugin.summary
+        duration_stats = plugin.duration_stats()
+        pass_rate = (summary["passed"] / summary["total"]) * 100 if summary["total"] > 0 else 0
+        summary_cards = {
+            "total": summary["total"],
+            "passed": summary["passed"],
+            "failed": summary["failed"],
+            "skipped": summary["skipped"],
+            "error": summary["error"],
+            "duration": f"{summary['duration']:.2f}",
+            "pass-rate": f"{pass_rate:.1f}%",
+            "p50": _format_duration(duration_stats["overall"]["p50"]),
+            "p90": _format_duration(duration_stats["overall"]["p90"]),
+            "p99": _format_duration(duration_stats["overall"]["p99"])
+        }
+
+        values = {
+            "categories": json.dumps(dict(plugin.categories)),
+            "duration_stats": json.dumps(duration_stats),
+            "duration_bins": json.dumps(plugin.durations.bins()),
+            "summary_cards": json.dumps(summary_cards),
+            "timeline": json.dumps(plugin.timeline.to_dict()),
+            "passed": summary["passed"],
+            "failed": summary["failed"],
+            "skipped": summary["skipped"],
+            "error": summary["error"]
+        }
+        before_spans, after_spans = self._tail.split("{timeline_spans}")
+
+        self._file.write("\n]")
+        self._file.write(before_spans.format(**values))
+        self._spans.copy_to(self._file)
+        self._file.write(after_spans.format(**values))
+        self._file.close()
+
+        print(f"Test report generated: {os.path.abspath(self.output_file)}")
+
+
+class JSONExporter(Exporter):
+    """Stream the JSON report."""
+
+    def start(self, plugin):
+        self._file = open(self.output_file, "w")
+        self._file.write('{\n  "tests": [')
+        self._separator = "\n"
+        self._spans = _JSONArraySpool(indent="    ")
+
+    def write_record(self, record):
+        self._file.write(self._separator)
+        self._file.write(textwrap.indent(json.dumps(record, indent=2), "    "))
+        self._separator = ",\n"
+
+    def write_span(self, span):
+        self._spans.write(span)
+
+    def finish(self, plugin):
+        report_data = {
+            "summary": plugin.summary,
+            "categories": dict(plugin.categories),
+            "duration_stats": plugin.duration_stats(),
+            "timeline": plugin.timeline.to_dict(),
+            "rootdir": plugin.rootdir,
+            "timestamp": datetime.now().isoformat()
+        }
+
+        # Continue the object opened in start, after the tests array
+        self._file.write('\n  ],\n  "timeline_spans": ')
+        self._spans.copy_to(self._file, closing_indent="  ")
+        self._file.write(",")
+        self._file.write(json.dumps(report_data, indent=2)[1:])
+        self._file.close()
+
+        print(f"JSON report generated: {os.path.abspath(self.output_file)}")
+
+
+class JUnitXMLExporter(Exporter):
+    """Stream a JUnit XML report.
+
+    The testsuite element carries the totals, which are only known at the end,
+    so test cases are streamed to a temporary spool file which is then copied
+    into the report. Failures outside the call phase, such as fixture setup
+    and teardown errors, are reported as errors.
+    """
+
+    def __init__(self, output_file, suite_name="pytest"):
+        super().__init__(output_file)
+        self.suite_name = suite_name
+
+    def start(self, plugin):
+        # XMLGenerator encodes to the binary spool itself, all writes go through it
+        self._spool = tempfile.TemporaryFile()
+        self._xml = XMLGenerator(self._spool, "utf-8", short_empty_elements=True)
+        self._counts = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0}
+
+    def write_record(self, record):
+        parts = record.get("nodeid", f"{record['file']}::{record['name']}").split("::")
+        module = os.path.splitext(parts[0])[0].replace("/", ".").replace("\\", ".")
+        classname = ".".join([module] + parts[1:-1])
+
+        self._counts["tests"] += 1
+
+        self._xml.ignorableWhitespace("\n    ")
+        self._xml.startElement("testcase", {
+            "classname": classname,
+            "name": parts[-1],
+            # Like pytest's own junitxml, the time covers setup, call and teardown
+            "time": f"{record.get('total_duration', record['duration']):.3f}"
+        })
+        if record["outcome"] in ("failed", "error"):
+            # Reports written before the phase was recorded only have call failures
+            when = record.get("when", "call")
+            if record["outcome"] == "failed" and when == "call":
+                self._counts["failures"] += 1
+                self._write_error("failure", record["error_message"], record.get("message"))
+            else:
+                self._counts["errors"] += 1
+                self._write_error("error", record["error_message"], record.get("message"), when)
+        elif record["outcome"] == "skipped":
+            self._counts["skipped"] += 1
+            skip_type = "pytest.xfail" if record.get("xfail") else "pytest.skip"
+            reason = _ILLEGAL_XML_CHARS.sub("?", record.get("skip_reason", ""))
+            self._xml.startElement("skipped", {"type": skip_type, "message": reason})
+            self._xml.endElement("skipped")
+        # A failed test can also fail its teardown, which is an error of its own
+        if record.get("teardown_error"):
+            self._counts["errors"] += 1
+            self._write_error("error", record["teardown_error"], record.get("teardown_message"), "teardown")
+        self._xml.endElement("testcase")
+
+    def _write_error(self, tag, error_message, message, when=None):
+        text = _ILLEGAL_XML_CHARS.sub("?", error_message)
+        if not message:
+            # Reports written before crash messages were recorded
+            lines = text.strip().splitlines()
+            message = lines[-1] if lines else ""
+        if when is not None:
+            message = f'failed on {when} with "{message}"'
+        self._xml.startElement(tag, {"message": _ILLEGAL_XML_CHARS.sub("?", message)})
+        self._xml.characters(text)
+        self._xml.endElement(tag)
+
+    def finish(self, plugin):
+        with open(self.output_file, "wb") as f:
+            xml = XMLGenerator(f, "utf-8")
+            xml.startDocument()
+            xml.startElement("testsuites", {})
+            xml.ignorableWhitespace("\n  ")
+            xml.startElement("testsuite", {
+                "name": self.suite_name,
+                "tests": str(self._counts["tests"]),
+                "failures": str(self._counts["failures"]),
+                "errors": str(self._counts["errors"]),
+                "skipped": str(self._counts["skipped"]),
+                "time": f"{plugin.summary['duration']:.3f}",
+                "timestamp": datetime.now().isoformat(),
+                "hostname": socket.gethostname()
+            })
+
+            self._xml.endDocument()
+            self._spool.seek(0)
+            shutil.copyfileobj(self._spool, f)
+            self._spool.close()
+
+            xml.ignorableWhitespace("\n  ")
+            xml.endElement("testsuite")
+            xml.ignorableWhitespace("\n")
+            xml.endElement("testsuites")
+            xml.ignorableWhitespace("\n")
+            xml.endDocument()
+
+        print(f"JUnit XML report generated: {os.path.abspath(self.output_file)}")
+
+
+_HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>API Test Report</title>
+    <style>
+        body {{
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            margin: 0;
+            padding: 20px;
+            background-color: #f5f5f5;
+            color: #333;
+        }}
+        .container {{
+            max-width: 1200px;
+            margin: 0 auto;
+            background-color: white;
+            padding: 20px;
+            border-radius: 5px;
+            box-shadow: 0 2px 10px rgba(0, 0, 0, 0.1);
+        }}
+        h1, h2, h3 {{
+            color: #2c3e50;
+        }}
+        .header {{
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            margin-bottom: 20px;
+            padding-bottom: 20px;
+            border-bottom: 1px solid #eee;
+        }}
+        .timestamp {{
+            font-size: 14px;
+            color: #7f8c8d;
+        }}
+        .summary-container {{
+            display: flex;
+            flex-wrap: wrap;
+            gap: 15px;
+            margin-bottom: 30px;
+        }}
+        .summary-card {{
+            flex: 1;
+            min-width: 150px;
+            padding: 15px;
+            border-radius: 5px;
+            box-shadow: 0 2px 5px rgba(0, 0, 0, 0.1);
+            text-align: center;
+        }}
+        .card-title {{
+            font-size: 14px;
+            font-weight: bold;
+            margin-bottom: 10px;
+        }}
+        .card-value {{
+            font-size: 24px;
+            font-weight: bold;
+        }}
+        .pass {{
+            background-color: #e8f5e9;
+            color: #2e7d32;
+        }}
+        .fail {{
+            background-color: #ffebee;
+            color: #c62828;
+        }}
+        .skip {{
+            background-color: #e3f2fd;
+            color: #1565c0;
+        }}
+        .error {{
+            background-color: #fff3e0;
+            color: #e65100;
+        }}
+        .total {{
+            background-color: #f3e5f5;
+            color: #6a1b9a;
+        }}
+        .time {{
+            background-color: #e8eaf6;
+            color: #283593;
+        }}
+        .rate {{
+            background-color: #e0f2f1;
+            color: #00695c;
+        }}
+        .chart-container {{
+            display: flex;
+            gap: 30px;
+            margin-bottom: 30px;
+        }}
+        .chart {{
+            flex: 1;
+            height: 300px;
+            background-color: white;
+            padding: 15px;
+            border-radius: 5px;
+            box-shadow: 0 2px 5px rgba(0, 0, 0, 0.1);
+        }}
+        .test-table {{
+            width: 100%;
+            border-collapse: collapse;
+            margin-top: 20px;
+        }}
+        .test-table th, .test-table td {{
+            text-align: left;
+            padding: 12px 15px;
+            border-bottom: 1px solid #ddd;
+        }}
+        .test-table th {{
+            background-color: #f8f9fa;
+            font-weight: bold;
+        }}
+        .test-table tr:nth-child(even) {{
+            background-color: #f8f9fa;
+        }}
+        .status-badge {{
+            display: inline-block;
+            padding: 5px 10px;
+            border-radius: 20px;
+            font-size: 12px;
+            font-weight: bold;
+            text-transform: uppercase;
+        }}
+        .passed {{
+            background-color: #e8f5e9;
+            color: #2e7d32;
+        }}
+        .failed {{
+            background-color: #ffebee;
+            color: #c62828;
+        }}
+        .skipped {{
+            background-color: #e3f2fd;
+            color: #1565c0;
+        }}
+        .error-badge {{
+            background-color: #fff3e0;
+            color: #e65100;
+        }}
+        .details-row {{
+            display: none;
+            background-color: #f9f9f9;
+        }}
+        .details-content {{
+            padding: 15px;
+            white-space: pre-wrap;
+            font-family: monospace;
+            font-size: 13px;
+            color: #333;
+        }}
+        .error-message {{
+            background-color: #ffebee;
+            padding: 10px;
+            border-radius: 4px;
+            margin-top: 10px;
+            white-space: pre-wrap;
+            font-family: monospace;
+            font-size: 12px;
+            color: #c62828;
+        }}
+        .filter-container {{
+            display: flex;
+            gap: 10px;
+            margin-bottom: 20px;
+        }}
+        .filter-dropdown {{
+            padding: 8px 12px;
+            border: 1px solid #ddd;
+            border-radius: 4px;
+            background-color: white;
+        }}
+        .attempts {{
+            color: #7f8c8d;
+            font-weight: normal;
+        }}
+        .percentiles {{
+            flex: 1;
+            overflow-x: auto;
+        }}
+        .percentile-table {{
+            margin-top: 0;
+        }}
+        .timeline-controls {{
+            display: flex;
+            align-items: center;
+            gap: 10px;
+            margin-bottom: 10px;
+        }}
+        .timeline-hint {{
+            font-size: 13px;
+            color: #7f8c8d;
+        }}
+        .timeline-container {{
+            position: relative;
+            margin-bottom: 30px;
+        }}
+        .timeline-container canvas {{
+            display: block;
+            cursor: grab;
+        }}
+        .timeline-tooltip {{
+            position: absolute;
+            display: none;
+            padding: 6px 8px;
+            border-radius: 4px;
+            background-color: rgba(44, 62, 80, 0.9);
+            color: white;
+            font-size: 12px;
+            white-space: nowrap;
+            pointer-events: none;
+        }}
+        .search-input {{
+            flex: 1;
+            padding: 8px 12px;
+            border: 1px solid #ddd;
+            border-radius: 4px;
+        }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>FastAPI Tasks API Test Report</h1>
+            <div class="timestamp">Generated on: {datetime}</div>
+        </div>
+        
+        <div class="summary-container">
+            <div class="summary-card total">
+                <div class="card-title">TOTAL TESTS</div>
+                <div class="card-value" id="card-total"></div>
+            </div>
+            <div class="summary-card pass">
+                <div class="card-title">PASSED</div>
+                <div class="card-value" id="card-passed"></div>
+            </div>
+            <div class="summary-card fail">
+                <div class="card-title">FAILED</div>
+                <div class="card-value" id="card-failed"></div>
+            </div>
+            <div class="summary-card skip">
+                <div class="card-title">SKIPPED</div>
+                <div class="card-value" id="card-skipped"></div>
+            </div>
+            <div class="summary-card error">
+                <div class="card-title">ERROR</div>
+                <div class="card-value" id="card-error"></div>
+            </div>
+            <div class="summary-card time">
+                <div class="card-title">DURATION (s)</div>
+                <div class="card-value" id="card-duration"></div>
+            </div>
+            <div class="summary-card rate">
+                <div class="card-title">PASS RATE</div>
+                <div class="card-value" id="card-pass-rate"></div>
+            </div>
+            <div class="summary-card time">
+                <div class="card-title">P50 (s)</div>
+                <div class="card-value" id="card-p50"></div>
+            </div>
+            <div class="summary-card time">
+                <div class="card-title">P90 (s)</div>
+                <div class="card-value" id="card-p90"></div>
+            </div>
+            <div class="summary-card time">
+                <div class="card-title">P99 (s)</div>
+                <div class="card-value" id="card-p99"></div>
+            </div>
+        </div>
+        
+        <div class="chart-container">
+            <div class="chart" id="results-chart">
+                <h3>Test Results</h3>
+                <canvas id="results-pie-chart"></canvas>
+            </div>
+            <div class="chart" id="categories-chart">
+                <h3>Tests by Category</h3>
+                <canvas id="categories-bar-chart"></canvas>
+            </div>
+        </div>
+        
+        <h2>Test Durations</h2>
+        
+        <div class="chart-container">
+            <div class="chart" id="durations-chart">
+                <h3>Duration Histogram</h3>
+                <canvas id="durations-histogram-chart"></canvas>
+            </div>
+        </div>
+        
+        <div class="chart-container">
+            <div class="percentiles">
+                <h3>By Category</h3>
+                <table class="test-table percentile-table">
+                    <thead>
+                        <tr>
+                            <th>Category</th>
+                            <th>Timed Tests</th>
+                            <th>P50 (s)</th>
+                            <th>P90 (s)</th>
+                            <th>P99 (s)</th>
+                        </tr>
+                    </thead>
+                    <tbody id="category-percentiles-body"></tbody>
+                </table>
+            </div>
+            <div class="percentiles">
+                <h3>By File</h3>
+                <table class="test-table percentile-table">
+                    <thead>
+                        <tr>
+                            <th>File</th>
+                            <th>Timed Tests</th>
+                            <th>P50 (s)</th>
+                            <th>P90 (s)</th>
+                            <th>P99 (s)</th>
+                        </tr>
+                    </thead>
+                    <tbody id="file-percentiles-body"></tbody>
+                </table>
+            </div>
+        </div>
+        
+        <div id="timeline-section">
+            <h2>Worker Timeline</h2>
+            
+            <p id="timeline-summary"></p>
+            
+            <div class="timeline-controls">
+                <button class="filter-dropdown" id="timeline-zoom-in">Zoom In</button>
+                <button class="filter-dropdown" id="timeline-zoom-out">Zoom Out</button>
+                <button class="filter-dropdown" id="timeline-reset">Reset</button>
+                <span class="timeline-hint">Scroll to zoom, drag to pan</span>
+            </div>
+            
+            <div class="timeline-container">
+                <canvas id="timeline-canvas"></canvas>
+                <div class="timeline-tooltip" id="timeline-tooltip"></div>
+            </div>
+            
+            <div class="chart-container">
+                <div class="percentiles">
+                    <h3>Idle Gaps</h3>
+                    <table class="test-table percentile-table">
+                        <thead>
+                            <tr>
+                                <th>Worker</th>
+                                <th>Tests</th>
+                                <th>Startup (s)</th>
+                                <th>Busy (s)</th>
+                                <th>Idle (s)</th>
+                                <th>Utilization</th>
+                                <th>Largest Gap (s)</th>
+                                <th>Finished (s)</th>
+                            </tr>
+                        </thead>
+                        <tbody id="timeline-workers-body"></tbody>
+                    </table>
+                </div>
+                <div class="percentiles">
+                    <h3>Critical Path Stragglers</h3>
+                    <table class="test-table percentile-table">
+                        <thead>
+                            <tr>
+                                <th>Test</th>
+                                <th>Duration (s)</th>
+                            </tr>
+                        </thead>
+                        <tbody id="timeline-stragglers-body"></tbody>
+                    </table>
+                </div>
+            </div>
+        </div>
+        
+        <h2>Test Details</h2>
+        
+        <div class="filter-container">
+            <select class="filter-dropdown" id="status-filter">
+                <option value="all">All Statuses</option>
+                <option value="passed">Passed</option>
+                <option value="failed">Failed</option>
+                <option value="skipped">Skipped</option>
+                <option value="error">Error</option>
+            </select>
+            <select class="filter-dropdown" id="category-filter">
+                <option value="all">All Categories</option>
+            </select>
+            <input type="text" class="search-input" id="search-input" placeholder="Search test names...">
+        </div>
+        
+        <table class="test-table" id="test-table">
+            <thead>
+                <tr>
+                    <th>Test Name</th>
+                    <th>Category</th>
+                    <th>Status</th>
+                    <th>Duration (s)</th>
+                </tr>
+            </thead>
+            <tbody id="test-table-body">
+                <!-- Test rows will be populated by JavaScript -->
+            </tbody>
+        </table>
+    </div>
+    
+    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
+    <script>
+        // Parse test results and categories from JSON
+        const testResults = {test_results};
+        const categories = {categories};
+        const durationStats = {duration_stats};
+        const durationBins = {duration_bins};
+        const summaryCards = {summary_cards};
+        const timeline = {timeline};
+        const timelineSpans = {timeline_spans};
+        
+        const TIMELINE_LABEL_WIDTH = 140;
+        const TIMELINE_AXIS_HEIGHT = 24;
+        const TIMELINE_ROW_HEIGHT = 22;
+        const TIMELINE_BINS = 4096;
+        const PHASE_COLORS = {{setup: '#ffa726', teardown: '#ab47bc'}};
+        const OUTCOME_COLORS = {{passed: '#66bb6a', failed: '#ef5350', skipped: '#42a5f5'}};
+        
+        // Function to initialize the dashboard
+        function initializeDashboard() {{
+            populateSummaryCards();
+            renderResultsChart();
+            renderCategoriesChart();
+            renderDurationsChart();
+            populatePercentileTable('category-percentiles-body', durationStats.categories);
+            populatePercentileTable('file-percentiles-body', durationStats.files);
+            renderTimeline();
+            populateTestTable();
+            setupFilters();
+        }}
+        
+        // Fill in the summary cards
+        function populateSummaryCards() {{
+            Object.keys(summaryCards).forEach(id => {{
+                document.getElementById(`card-${{id}}`).textContent = summaryCards[id];
+            }});
+        }}
+        
+        // Render test results pie chart
+        function renderResultsChart() {{
+            const ctx = document.getElementById('results-pie-chart').getContext('2d');
+            new Chart(ctx, {{
+                type: 'pie',
+                data: {{
+                    labels: ['Passed', 'Failed', 'Skipped', 'Error'],
+                    datasets: [{{
+                        data: [{passed}, {failed}, {skipped}, {error}],
+                        backgroundColor: [
+                            '#66bb6a',  // green
+                            '#ef5350',  // red
+                            '#42a5f5',  // blue
+                            '#ffa726'   // orange
+                        ],
+                        borderWidth: 1
+                    }}]
+                }},
+                options: {{
+                    responsive: true,
+                    maintainAspectRatio: false,
+                    legend: {{
+                        position: 'right'
+                    }}
+                }}
+            }});
+        }}
+        
+        // Render categories bar chart
+        function renderCategoriesChart() {{
+            const categoryNames = Object.keys(categories);
+            const passedData = categoryNames.map(cat => categories[cat].passed || 0);
+            const failedData = categoryNames.map(cat => categories[cat].failed || 0);
+            const skippedData = categoryNames.map(cat => categories[cat].skipped || 0);
+            const errorData = categoryNames.map(cat => categories[cat].error || 0);
+            
+            const ctx = document.getElementById('categories-bar-chart').getContext('2d');
+            new Chart(ctx, {{
+                type: 'bar',
+                data: {{
+                    labels: categoryNames,
+                    datasets: [
+                        {{
+                            label: 'Passed',
+                            backgroundColor: '#66bb6a',
+                            data: passedData
+                        }},
+                        {{
+                            label: 'Failed',
+                            backgroundColor: '#ef5350',
+                            data: failedData
+                        }},
+                        {{
+                            label: 'Skipped',
+                            backgroundColor: '#42a5f5',
+                            data: skippedData
+                        }},
+                        {{
+                            label: 'Error',
+                            backgroundColor: '#ffa726',
+                            data: errorData
+                        }}
+                    ]
+                }},
+                options: {{
+                    responsive: true,
+                    maintainAspectRatio: false,
+                    scales: {{
+                        xAxes: [{{
+                            stacked: true,
+                            gridLines: {{
+                                display: false
+                            }}
+                        }}],
+                        yAxes: [{{
+                            stacked: true,
+                            ticks: {{
+                                beginAtZero: true
+                            }}
+                        }}]
+                    }}
+                }}
+            }});
+        }}
+        
+        // Render test duration histogram
+        function renderDurationsChart() {{
+            const formatBound = value => value < 1 ? `${{(value * 1000).toPrecision(2)}}ms` : `${{value.toPrecision(3)}}s`;
+            const labels = durationBins.map(bin => `${{formatBound(bin.lower)}}-${{formatBound(bin.upper)}}`);
+            
+            const ctx = document.getElementById('durations-histogram-chart').getContext('2d');
+            new Chart(ctx, {{
+                type: 'bar',
+                data: {{
+                    labels: labels,
+                    datasets: [{{
+                        label: 'Tests',
+                        backgroundColor: '#5c6bc0',
+                        data: durationBins.map(bin => bin.count)
+                    }}]
+                }},
+                options: {{
+                    responsive: true,
+                    maintainAspectRatio: false,
+                    scales: {{
+                        yAxes: [{{
+                            ticks: {{
+                                beginAtZero: true
+                            }}
+                        }}]
+                    }}
+                }}
+            }});
+        }}
+        
+        // Populate a duration percentile table
+        function populatePercentileTable(tableBodyId, stats) {{
+            const tableBody = document.getElementById(tableBodyId);
+            const formatDuration = value => value === null ? '-' : value.toFixed(3);
+            
+            Object.keys(stats).forEach(name => {{
+                const row = document.createElement('tr');
+                row.innerHTML = `
+                    <td>${{name}}</td>
+                    <td>${{stats[name].count}}</td>
+                    <td>${{formatDuration(stats[name].p50)}}</td>
+                    <td>${{formatDuration(stats[name].p90)}}</td>
+                    <td>${{formatDuration(stats[name].p99)}}</td>
+                `;
+                tableBody.appendChild(row);
+            }});
+        }}
+        
+        // Group timeline spans per worker and build level-of-detail bins
+        function buildTimelineRows() {{
+            // Span times are relative to the session start
+            const wall = timeline.summary.end;
+            const rows = timeline.workers.map(name => ({{name: name, spans: []}}));
+            timelineSpans.forEach(span => rows[span[0]].spans.push(span));
+            
+            rows.forEach(row => {{
+                row.spans.sort((a, b) => a[1] - b[1]);
+                row.starts = Float64Array.from(row.spans, span => span[1]);
+                
+                // Finest level: busy seconds and failures per bin
+                const binWidth = wall / TIMELINE_BINS || 1;
+                const coverage = new Float64Array(TIMELINE_BINS);
+                const failed = new Uint8Array(TIMELINE_BINS);
+                row.spans.forEach(span => {{
+                    const first = Math.min(TIMELINE_BINS - 1, Math.floor(span[1] / binWidth));
+                    const last = Math.min(TIMELINE_BINS - 1, Math.floor(span[2] / binWidth));
+                    for (let bin = first; bin <= last; bin++) {{
+                        coverage[bin] += Math.max(0, Math.min(span[2], (bin + 1) * binWidth) - Math.max(span[1], bin * binWidth));
+                        if (timeline.outcomes[span[4]] === 'failed') {{
+                            failed[bin] = 1;
+                        }}
+                    }}
+                }});
+                
+                // Each coarser level halves the number of bins
+                row.levels = [{{binWidth: binWidth, coverage: coverage, failed: failed}}];
+                while (row.levels[row.levels.length - 1].coverage.length > 64) {{
+                    const finer = row.levels[row.levels.length - 1];
+                    const size = finer.coverage.length / 2;
+                    const level = {{binWidth: finer.binWidth * 2, coverage: new Float64Array(size), failed: new Uint8Array(size)}};
+                    for (let bin = 0; bin < size; bin++) {{
+                        level.coverage[bin] = finer.coverage[2 * bin] + finer.coverage[2 * bin + 1];
+                        level.failed[bin] = finer.failed[2 * bin] | finer.failed[2 * bin + 1];
+                    }}
+                    row.levels.push(level);
+                }}
+            }});
+            return rows;
+        }}
+        
+        // Index of the last span of a row starting at or before the given time
+        function findSpan(row, time) {{
+            let low = 0;
+            let high = row.starts.length - 1;
+            while (low < high) {{
+                const mid = (low + high + 1) >> 1;
+                if (row.starts[mid] <= time) {{
+                    low = mid;
+                }} else {{
+                    high = mid - 1;
+                }}
+            }}
+            return low;
+        }}
+        
+        // Render the zoomable worker timeline
+        function renderTimeline() {{
+            if (!timeline.summary) {{
+                document.getElementById('timeline-section').style.display = 'none';
+                return;
+            }}
+            
+            const canvas = document.getElementById('timeline-canvas');
+            const tooltip = document.getElementById('timeline-tooltip');
+            const rows = buildTimelineRows();
+            const wall = timeline.summary.end || 1;
+            const ratio = window.devicePixelRatio || 1;
+            const height = TIMELINE_AXIS_HEIGHT + rows.length * TIMELINE_ROW_HEIGHT;
+            const view = {{start: 0, end: wall}};
+            let width = 0;
+            let drawPending = false;
+            let drag = null;
+            
+            const plotWidth = () => width - TIMELINE_LABEL_WIDTH;
+            const toX = time => TIMELINE_LABEL_WIDTH + (time - view.start) / (view.end - view.start) * plotWidth();
+            const toTime = x => view.start + (x - TIMELINE_LABEL_WIDTH) / plotWidth() * (view.end - view.start);
+            
+            function draw() {{
+                drawPending = false;
+                const ctx = canvas.getContext('2d');
+                const secondsPerPixel = (view.end - view.start) / plotWidth();
+                ctx.setTransform(ratio, 0, 0, ratio, 0, 0);
+                ctx.clearRect(0, 0, width, height);
+                ctx.font = '12px sans-serif';
+                
+                // Time axis with round tick steps
+                const rawStep = (view.end - view.start) / 8;
+                const magnitude = Math.pow(10, Math.floor(Math.log10(rawStep)));
+                const step = [1, 2, 5, 10].map(f => f * magnitude).find(s => s >= rawStep);
+                const decimals = Math.max(0, -Math.floor(Math.log10(step)));
+                ctx.fillStyle = '#7f8c8d';
+                ctx.strokeStyle = '#eee';
+                for (let tick = Math.ceil(view.start / step) * step; tick <= view.end; tick += step) {{
+                    const x = toX(tick);
+                    ctx.fillText(`${{tick.toFixed(decimals)}}s`, x + 2, 14);
+                    ctx.beginPath();
+                    ctx.moveTo(x, TIMELINE_AXIS_HEIGHT - 6);
+                    ctx.lineTo(x, height);
+                    ctx.stroke();
+                }}
+                
+                rows.forEach((row, index) => {{
+                    const y = TIMELINE_AXIS_HEIGHT + index * TIMELINE_ROW_HEIGHT;
+                    ctx.globalAlpha = 1;
+                    ctx.fillStyle = '#333';
+                    ctx.fillText(row.name, 4, y + 15, TIMELINE_LABEL_WIDTH - 8);
+                    
+                    ctx.save();
+                    ctx.beginPath();
+                    ctx.rect(TIMELINE_LABEL_WIDTH, y, plotWidth(), TIMELINE_ROW_HEIGHT);
+                    ctx.clip();
+                    
+                    if (row.levels[0].binWidth >= 2 * secondsPerPixel) {{
+                        // Zoomed in far enough to draw the individual spans,
+                        // skipping sub-pixel spans that land on an already drawn pixel
+                        let lastPixel = -1;
+                        for (let i = findSpan(row, view.start); i < row.spans.length && row.spans[i][1] <= view.end; i++) {{
+                            const span = row.spans[i];
+                            const x = toX(span[1]);
+                            const spanWidth = (span[2] - span[1]) / secondsPerPixel;
+                            if (spanWidth < 1 && Math.floor(x) === lastPixel) {{
+                                continue;
+                            }}
+                            lastPixel = Math.floor(x + Math.max(1, spanWidth)) - 1;
+                            ctx.fillStyle = PHASE_COLORS[timeline.phases[span[3]]] || OUTCOME_COLORS[timeline.outcomes[span[4]]];
+                            ctx.fillRect(x, y + 3, Math.max(1, spanWidth), TIMELINE_ROW_HEIGHT - 6);
+                        }}
+                    }} else {{
+                        // Draw the bins of the finest level that is at least a pixel wide
+                        const level = row.levels.find(level => level.binWidth >= secondsPerPixel) || row.levels[row.levels.length - 1];
+                        const last = Math.min(level.coverage.length - 1, Math.floor(view.end / level.binWidth));
+                        for (let bin = Math.max(0, Math.floor(view.start / level.binWidth)); bin <= last; bin++) {{
+                            if (level.coverage[bin] > 0) {{
+                                ctx.globalAlpha = Math.min(1, 0.25 + 0.75 * level.coverage[bin] / level.binWidth);
+                                ctx.fillStyle = level.failed[bin] ? OUTCOME_COLORS.failed : OUTCOME_COLORS.passed;
+                                ctx.fillRect(toX(bin * level.binWidth), y + 3, Math.max(1, level.binWidth / secondsPerPixel), TIMELINE_ROW_HEIGHT - 6);
+                            }}
+                        }}
+                    }}
+                    ctx.restore();
+                }});
+            }}
+            
+            function scheduleDraw() {{
+                if (!drawPending) {{
+                    drawPending = true;
+                    window.requestAnimationFrame(draw);
+                }}
+            }}
+            
+            function resize() {{
+                width = canvas.parentElement.clientWidth;
+                canvas.width = width * ratio;
+                canvas.height = height * ratio;
+                canvas.style.width = `${{width}}px`;
+                canvas.style.height = `${{height}}px`;
+                scheduleDraw();
+            }}
+            
+            // Keep the view inside the session, at most a microsecond wide
+            function setView(start, end) {{
+                const span = Math.min(wall, Math.max(1e-6, end - start));
+                start = Math.min(Math.max(0, start), wall - span);
+                view.start = start;
+                view.end = start + span;
+                scheduleDraw();
+            }}
+            
+            function zoomAt(time, factor) {{
+                setView(time - (time - view.start) * factor, time + (view.end - time) * factor);
+            }}
+            
+            canvas.addEventListener('wheel', event => {{
+                event.preventDefault();
+                const x = event.clientX - canvas.getBoundingClientRect().left;
+                zoomAt(toTime(Math.max(TIMELINE_LABEL_WIDTH, x)), event.deltaY < 0 ? 0.8 : 1.25);
+            }});
+            canvas.addEventListener('mousedown', event => {{
+                drag = {{x: event.clientX, start: view.start, end: view.end}};
+                canvas.style.cursor = 'grabbing';
+            }});
+            window.addEventListener('mouseup', () => {{
+                drag = null;
+                canvas.style.cursor = 'grab';
+            }});
+            canvas.addEventListener('mouseleave', () => {{
+                tooltip.style.display = 'none';
+            }});
+            canvas.addEventListener('mousemove', event => {{
+                const rect = canvas.getBoundingClientRect();
+                const x = event.clientX - rect.left;
+                const y = event.clientY - rect.top;
+                
+                if (drag) {{
+                    const shift = (event.clientX - drag.x) / plotWidth() * (drag.end - drag.start);
+                    setView(drag.start - shift, drag.end - shift);
+                    tooltip.style.display = 'none';
+                    return;
+                }}
+                
+                // Show the span under the cursor
+                const row = rows[Math.floor((y - TIMELINE_AXIS_HEIGHT) / TIMELINE_ROW_HEIGHT)];
+                const time = toTime(x);
+                const span = row && x >= TIMELINE_LABEL_WIDTH && row.spans.length ? row.spans[findSpan(row, time)] : null;
+                if (span && span[1] <= time && time <= span[2] + (view.end - view.start) / plotWidth()) {{
+                    tooltip.textContent = `${{span[5]}} (${{timeline.phases[span[3]]}}, ${{timeline.outcomes[span[4]]}}) ${{(span[2] - span[1]).toFixed(3)}}s`;
+                    tooltip.style.left = `${{x + 12}}px`;
+                    tooltip.style.top = `${{y + 12}}px`;
+                    tooltip.style.display = 'block';
+                }} else {{
+                    tooltip.style.display = 'none';
+                }}
+            }});
+            
+            document.getElementById('timeline-zoom-in').addEventListener('click', () => zoomAt((view.start + view.end) / 2, 0.5));
+            document.getElementById('timeline-zoom-out').addEventListener('click', () => zoomAt((view.start + view.end) / 2, 2));
+            document.getElementById('timeline-reset').addEventListener('click', () => setView(0, wall));
+            window.addEventListener('resize', resize);
+            resize();
+            
+            populateTimelineSummary();
+        }}
+        
+        // Populate the idle gap and critical path straggler tables
+        function populateTimelineSummary() {{
+            const summary = timeline.summary;
+            document.getElementById('timeline-summary').textContent =
+                `${{summary.wall.toFixed(2)}}s wall time on ${{summary.workers.length}} worker(s) ` +
+                `after ${{summary.startup.toFixed(2)}}s of collection and startup, ` +
+                `${{summary.ideal.toFixed(2)}}s if the ${{summary.busy.toFixed(2)}}s of test time were spread evenly ` +
+                `(${{(summary.utilization * 100).toFixed(1)}}% utilization). ` +
+                `${{summary.critical_worker}} finished last, ${{summary.tail.toFixed(2)}}s after the other workers.`;
+            
+            const workersBody = document.getElementById('timeline-workers-body');
+            summary.workers.forEach(worker => {{
+                const row = document.createElement('tr');
+                row.innerHTML = `
+                    <td>${{worker.worker}}</td>
+                    <td>${{worker.tests}}</td>
+                    <td>${{worker.startup.toFixed(3)}}</td>
+                    <td>${{worker.busy.toFixed(3)}}</td>
+                    <td>${{worker.idle.toFixed(3)}}</td>
+                    <td>${{(worker.utilization * 100).toFixed(1)}}%</td>
+                    <td>${{worker.largest_gap.toFixed(3)}}</td>
+                    <td>${{worker.last_stop.toFixed(3)}}</td>
+                `;
+                workersBody.appendChild(row);
+            }});
+            
+            const stragglersBody = document.getElementById('timeline-stragglers-body');
+            summary.stragglers.forEach(straggler => {{
+                const row = document.createElement('tr');
+                row.innerHTML = `
+                    <td>${{straggler.nodeid}}</td>
+                    <td>${{straggler.duration.toFixed(3)}}</td>
+                `;
+                stragglersBody.appendChild(row);
+            }});
+        }}
+        
+        // Populate the test details table
+        function populateTestTable() {{
+            const tableBody = document.getElementById('test-table-body');
+            tableBody.innerHTML = '';
+            
+            // Populate category filter dropdown
+            const categoryFilter = document.getElementById('category-filter');
+            const uniqueCategories = [...new Set(testResults.map(test => test.category))];
+            uniqueCategories.forEach(category => {{
+                const option = document.createElement('option');
+                option.value = category;
+                option.textContent = category;
+                categoryFilter.appendChild(option);
+            }});
+            
+            // Create table rows for each test
+            testResults.forEach((test, index) => {{
+                const row = document.createElement('tr');
+                row.setAttribute('data-test-index', index);
+                row.setAttribute('data-status', test.outcome);
+                row.setAttribute('data-category', test.category);
+                
+                // A failed test can also fail its teardown
+                const errorMessage = [test.error_message, test.teardown_error].filter(Boolean).join('\\n\\n');
+                
+                // Make the row expandable if it has an error message
+                if (errorMessage) {{
+                    row.classList.add('expandable');
+                    row.style.cursor = 'pointer';
+                    row.onclick = function() {{
+                        const detailsRow = document.getElementById(`details-row-${{index}}`);
+                        if (detailsRow.style.display === 'table-row') {{
+                            detailsRow.style.display = 'none';
+                        }} else {{
+                            detailsRow.style.display = 'table-row';
+                        }}
+                    }};
+                }}
+                
+                // Note reruns from an updated report
+                const attemptsLabel = test.attempts && test.attempts.length
+                    ? ` <small class="attempts">attempt ${{test.attempts.length + 1}} (previously ${{test.attempts.map(a => a.outcome).join(', ')}})</small>`
+                    : '';
+                
+                row.innerHTML = `
+                    <td><strong>${{test.name}}</strong>${{attemptsLabel}}<br><small>${{test.description}}</small></td>
+                    <td>${{test.category}}</td>
+                    <td><span class="status-badge ${{test.outcome}}">${{test.outcome}}</span></td>
+                    <td>${{test.duration.toFixed(3)}}</td>
+                `;
+                
+                tableBody.appendChild(row);
+                
+                // Add details row for errors
+                if (errorMessage) {{
+                    const detailsRow = document.createElement('tr');
+                    detailsRow.id = `details-row-${{index}}`;
+                    detailsRow.className = 'details-row';
+                    detailsRow.innerHTML = `
+                        <td colspan="4">
+                            <div class="details-content">
+                                <div class="error-message">${{errorMessage.replace(/</g, '&lt;').replace(/>/g, '&gt;')}}</div>
+                            </div>
+                        </td>
+                    `;
+                    tableBody.appendChild(detailsRow);
+                }}
+            }});
+        }}
+        
+        // Setup filters for the test table
+        function setupFilters() {{
+            const statusFilter = document.getElementById('status-filter');
+            const categoryFilter = document.getElementById('category-filter');
+            const searchInput = document.getElementById('search-input');
+            
+            function applyFilters() {{
+                const statusValue = statusFilter.value;
+                const categoryValue = categoryFilter.value;
+                const searchValue = searchInput.value.toLowerCase();
+                
+                const rows = document.querySelectorAll('#test-table-body > tr:not(.details-row)');
+                
+                rows.forEach(row => {{
+                    const testIndex = row.getAttribute('data-test-index');
+                    const detailsRow = document.getElementById(`details-row-${{testIndex}}`);
+                    
+                    const status = row.getAttribute('data-status');
+                    const category = row.getAttribute('data-category');
+                    const testName = testResults[testIndex].name.toLowerCase();
+                    const testDesc = testResults[testIndex].description.toLowerCase();
+                    
+                    const statusMatch = statusValue === 'all' || status === statusValue;
+                    const categoryMatch = categoryValue === 'all' || category === categoryValue;
+                    const searchMatch = searchValue === '' || 
+                                      testName.includes(searchValue) || 
+                                      testDesc.includes(searchValue);
+                    
+                    if (statusMatch && categoryMatch && searchMatch) {{
+                        row.style.display = 'table-row';
+                        if (detailsRow) {{
+                            // Keep details row hidden unless expanded
+                            detailsRow.style.display = 'none';
+                        }}
+                    }} else {{
+                        row.style.display = 'none';
+                        if (detailsRow) {{
+                            detailsRow.style.display = 'none';
+                        }}
+                    }}
+                }});
+            }}
+            
+            statusFilter.addEventListener('change', applyFilters);
+            categoryFilter.addEventListener('change', applyFilters);
+            searchInput.addEventListener('input', applyFilters);
+        }}
+        
+        // Initialize the dashboard when the page loads
+        document.addEventListener('DOMContentLoaded', initializeDashboard);
+    </script>
+</body>
+</html>
+"""
@@ -0,0 +1,165 @@
+import math
+
+
+class DurationHistogram:
+    """Mergeable log-bucketed histogram of test durations.
+
+    Bucket bounds grow geometrically, so every quantile is accurate to within
+    ``relative_accuracy`` of the true value and the number of buckets stays
+    bounded no matter how many durations are added. Bucket counts are plain
+    integers, so merging the histograms of several shards gives exactly the
+    histogram of the combined run.
+    """
+
+    def __init__(self, relative_accuracy=0.01, min_duration=1e-6, max_buckets=2048):
+        self.relative_accuracy = relative_accuracy
+        self.min_duration = min_duration
+        self.max_buckets = max_buckets
+        self.buckets = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        # Keys below the floor have been collapsed into it to bound memory
+        self.floor = None
+
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+
+    def _key(self, duration):
+        key = math.ceil(math.log(duration) / self._log_gamma)
+        if self.floor is not None and key < self.floor:
+            key = self.floor
+        return key
+
+    def _value(self, key):
+        # Midpoint of the bucket with relative error at most relative_accuracy
+        return 2 * self._gamma ** key / (self._gamma + 1)
+
+    def _collapse(self):
+        # Fold the lowest buckets together; the slowest tests matter most
+        keys = sorted(self.buckets)
+        while len(keys) > self.max_buckets:
+            lowest = keys.pop(0)
+            self.buckets[keys[0]] += self.buckets.pop(lowest)
+            self.floor = keys[0]
+
+    def add(self, duration, count=1):
+        """Add a duration (in seconds) to the histogram."""
+        if count < 1:
+            raise ValueError("count must be positive")
+        if duration < self.min_duration:
+            self.zero_count += count
+        else:
+            key = self._key(duration)
+            self.buckets[key] = self.buckets.get(key, 0) + count
+            if len(self.buckets) > self.max_buckets:
+                self._collapse()
+        self.count += count
+        self.sum += duration * count
+
+    def remove(self, duration):
+        """Remove a duration that was previously added."""
+        if duration < self.min_duration:
+            if self.zero_count < 1:
+                raise ValueError(f"Duration {duration} is not in the histogram")
+            self.zero_count -= 1
+        else:
+            key = self._key(duration)
+            if self.buckets.get(key, 0) < 1:
+                raise ValueError(f"Duration {duration} is not in the histogram")
+            self.buckets[key] -= 1
+            if self.buckets[key] == 0:
+                del self.buckets[key]
+        self.count -= 1
+        self.sum -= duration
+
+    def merge(self, other):
+        """Merge the counts of another histogram into this one."""
+        if (other.relative_accuracy != self.relative_accuracy
+                or other.min_duration != self.min_duration):
+            raise ValueError("Cannot merge histograms with different bucket layouts")
+
+        if other.floor is not None and (self.floor is None or other.floor > self.floor):
+            self.floor = other.floor
+            for key in [key for key in self.buckets if key < self.floor]:
+                self.buckets[self.floor] = self.buckets.get(self.floor, 0) + self.buckets.pop(key)
+
+        for key, count in other.buckets.items():
+            key = max(key, self.floor) if self.floor is not None else key
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        return self
+
+    def quantile(self, q):
+        """Return the approximate duration at quantile ``q`` (0 to 1)."""
+        if self.count <= 0:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen > rank:
+                return self._value(key)
+        return self._value(max(self.buckets))
+
+    def bins(self, max_bins=30):
+        """Return coarse histogram bins suitable for charting.
+
+        Neighbouring buckets are grouped so that at most ``max_bins`` bins
+        (plus one for durations below ``min_duration``) are returned.
+        """
+        bins = []
+        if self.zero_count:
+            bins.append({"lower": 0.0, "upper": self.min_duration, "count": self.zero_count})
+        if not self.buckets:
+            return bins
+
+        low, high = min(self.buckets), max(self.buckets)
+        width = max(1, math.ceil((high - low + 1) / max_bins))
+        for start in range(low, high + 1, width):
+            count = sum(self.buckets.get(key, 0) for key in range(start, start + width))
+            bins.append({
+                "lower": self._gamma ** (start - 1),
+                "upper": self._gamma ** (start + width - 1),
+                "count": count
+            })
+        return bins
+
+    def to_dict(self):
+        """Return a JSON-serializable representation of the histogram."""
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "min_duration": self.min_duration,
+            "max_buckets": self.max_buckets,
+            "count": self.count,
+            "sum": self.sum,
+            "zero_count": self.zero_count,
+            "floor": self.floor,
+            "buckets": {str(key): count for key, count in sorted(self.buckets.items())},
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99)
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create a histogram from the output of ``to_dict``."""
+        histogram = cls(
+            relative_accuracy=data["relative_accuracy"],
+            min_duration=data["min_duration"],
+            max_buckets=data["max_buckets"]
+        )
+        histogram.count = data["count"]
+        histogram.sum = data["sum"]
+        histogram.zero_count = data["zero_count"]
+        histogram.floor = data.get("floor")
+        histogram.buckets = {int(key): count for key, count in data["buckets"].items()}
+        return histogram
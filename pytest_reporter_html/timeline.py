@@ -0,0 +1,148 @@
+import heapq
+
+PHASES = ["setup", "call", "teardown"]
+OUTCOMES = ["passed", "failed", "skipped"]
+
+
+class _WorkerStats:
+    """Running utilization counters of one worker."""
+
+    def __init__(self, stragglers):
+        self.stragglers = stragglers
+        self.tests = 0
+        self.busy = 0.0
+        self.largest_gap = 0.0
+        self.first_start = None
+        self.last_stop = None
+        self.current_test = None
+        self.current_duration = 0.0
+        # Min-heap of (duration, nodeid) holding the worker's longest tests
+        self.longest = []
+
+    def add(self, nodeid, start, stop):
+        if self.first_start is None:
+            self.first_start = self.last_stop = start
+        elif start > self.last_stop:
+            self.largest_gap = max(self.largest_gap, start - self.last_stop)
+        # Only count time not already covered by an earlier span
+        self.busy += max(0.0, stop - max(start, self.last_stop))
+        self.last_stop = max(self.last_stop, stop)
+
+        # The phases of a test are run back to back on the same worker
+        if nodeid != self.current_test:
+            self._push_test()
+            self.current_test = nodeid
+            self.current_duration = 0.0
+            self.tests += 1
+        self.current_duration += stop - start
+
+    def _push_test(self):
+        if self.current_test is None:
+            return
+        heapq.heappush(self.longest, (self.current_duration, self.current_test))
+        if len(self.longest) > self.stragglers:
+            heapq.heappop(self.longest)
+
+    def longest_tests(self):
+        candidates = self.longest + [(self.current_duration, self.current_test)]
+        return heapq.nlargest(self.stragglers, candidates)
+
+
+class Timeline:
+    """Per-worker utilization of a session, built from its test phase spans.
+
+    Only running counters and the longest tests of each worker are kept, so
+    memory does not grow with the number of tests. ``add`` returns each phase
+    as a compact span for exporters to write out.
+    """
+
+    def __init__(self, start=None, stragglers=10):
+        self.start = start
+        self.stragglers = stragglers
+        self.workers = []
+        self._worker_index = {}
+        self._stats = []
+        self._summary = None
+
+    def add(self, worker, nodeid, phase, start, stop, outcome):
+        """Record one test phase run by a worker and return it as a span.
+
+        Span times are relative to ``start``, the start of the session.
+        """
+        if self.start is None:
+            self.start = start
+
+        index = self._worker_index.get(worker)
+        if index is None:
+            index = self._worker_index[worker] = len(self.workers)
+            self.workers.append(worker)
+            self._stats.append(_WorkerStats(self.stragglers))
+
+        start -= self.start
+        stop -= self.start
+        self._stats[index].add(nodeid, start, stop)
+        self._summary = None
+        return [index, round(start, 6), round(stop, 6), PHASES.index(phase), OUTCOMES.index(outcome), nodeid]
+
+    def summary(self):
+        """Summarize worker utilization, idle gaps and the critical path.
+
+        Collection and worker startup before a worker's first test are
+        reported as ``startup``, not as idle time: ``wall`` runs from the
+        earliest test start to the end of the last test, and each worker is
+        idle between its tests and while waiting for the others to finish.
+        The critical path is the worker that finished last. ``tail`` is how
+        long it kept running after every other worker was done, and its
+        longest tests are listed as stragglers.
+        """
+        if self._summary is not None or not self._stats:
+            return self._summary
+
+        first_start = min(stats.first_start for stats in self._stats)
+        end = max(stats.last_stop for stats in self._stats)
+        workers = []
+        for name, stats in zip(self.workers, self._stats):
+            active = end - stats.first_start
+            workers.append({
+                "worker": name,
+                "tests": stats.tests,
+                "startup": stats.first_start,
+                "busy": stats.busy,
+                "idle": active - stats.busy,
+                "utilization": stats.busy / active if active > 0 else 1.0,
+                # Waiting for the other workers to finish is idle time too
+                "largest_gap": max(stats.largest_gap, end - stats.last_stop),
+                "first_start": stats.first_start,
+                "last_stop": stats.last_stop
+            })
+
+        finish_order = sorted(range(len(workers)), key=lambda index: workers[index]["last_stop"])
+        critical = finish_order[-1]
+        tail = end - workers[finish_order[-2]]["last_stop"] if len(workers) > 1 else 0.0
+
+        total_busy = sum(worker["busy"] for worker in workers)
+        total_active = sum(end - worker["first_start"] for worker in workers)
+        self._summary = {
+            "startup": first_start,
+            "end": end,
+            "wall": end - first_start,
+            "busy": total_busy,
+            "ideal": total_busy / len(workers),
+            "utilization": total_busy / total_active if total_active > 0 else 1.0,
+            "critical_worker": self.workers[critical],
+            "tail": tail,
+            "workers": workers,
+            "stragglers": [{"nodeid": nodeid, "duration": duration}
+                           for duration, nodeid in self._stats[critical].longest_tests()]
+        }
+        return self._summary
+
+    def to_dict(self):
+        """Return a JSON-serializable representation of the timeline, without its spans."""
+        return {
+            "start": self.start,
+            "workers": self.workers,
+            "phases": PHASES,
+            "outcomes": OUTCOMES,
+            "summary": self.summary()
+        }
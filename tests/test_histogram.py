@@ -0,0 +1,136 @@
+import random
+
+import pytest
+
+from pytest_reporter_html.histogram import DurationHistogram
+
+
+def exact_quantile(durations, q):
+    """Return the quantile of ``durations`` with the rank used by the histogram."""
+    return sorted(durations)[int(q * (len(durations) - 1))]
+
+
+@pytest.fixture
+def durations():
+    rng = random.Random(42)
+    return [rng.lognormvariate(-3, 1.5) for _ in range(10000)]
+
+
+@pytest.mark.parametrize("q", [0.0, 0.1, 0.5, 0.9, 0.99, 1.0])
+def test_quantile_within_relative_accuracy(durations, q):
+    histogram = DurationHistogram()
+    for duration in durations:
+        histogram.add(duration)
+
+    expected = exact_quantile(durations, q)
+    assert histogram.quantile(q) == pytest.approx(expected, rel=0.01)
+
+
+def test_quantile_of_empty_histogram():
+    assert DurationHistogram().quantile(0.5) is None
+
+
+def test_durations_below_min_duration_are_zero():
+    histogram = DurationHistogram()
+    histogram.add(1e-9)
+    histogram.add(1.0)
+
+    assert histogram.zero_count == 1
+    assert histogram.quantile(0.0) == 0.0
+    assert histogram.quantile(1.0) == pytest.approx(1.0, rel=0.01)
+
+
+def test_merge_is_bucket_exact(durations):
+    combined = DurationHistogram()
+    shards = [DurationHistogram() for _ in range(4)]
+    for i, duration in enumerate(durations):
+        combined.add(duration)
+        shards[i % 4].add(duration)
+
+    merged = DurationHistogram()
+    for shard in shards:
+        merged.merge(shard)
+
+    assert merged.buckets == combined.buckets
+    assert merged.zero_count == combined.zero_count
+    assert merged.count == combined.count
+    assert merged.sum == pytest.approx(combined.sum)
+
+
+def test_merge_rejects_different_layouts():
+    with pytest.raises(ValueError):
+        DurationHistogram().merge(DurationHistogram(relative_accuracy=0.02))
+
+
+def test_merge_of_collapsed_histograms():
+    low = DurationHistogram(max_buckets=8)
+    high = DurationHistogram(max_buckets=8)
+    for i in range(16):
+        low.add(1e-3 * 1.1 ** i)
+        high.add(1.0 * 1.1 ** i)
+
+    merged = DurationHistogram(max_buckets=8).merge(low).merge(high)
+
+    assert len(merged.buckets) <= 8
+    assert merged.count == 32
+    assert min(merged.buckets) == merged.floor
+    # Collapsing only folds the fastest durations together
+    assert merged.quantile(1.0) == pytest.approx(1.1 ** 15, rel=0.01)
+
+
+def test_collapse_keeps_slowest_buckets():
+    histogram = DurationHistogram(max_buckets=8)
+    for i in range(100):
+        histogram.add(1e-3 * 1.1 ** i)
+
+    assert len(histogram.buckets) == 8
+    assert histogram.count == 100
+    assert sum(histogram.buckets.values()) == 100
+    assert histogram.quantile(1.0) == pytest.approx(1e-3 * 1.1 ** 99, rel=0.01)
+    # Durations below the floor now land in the floor bucket
+    histogram.add(1e-3)
+    assert histogram.buckets[histogram.floor] == 94
+
+
+def test_remove_restores_the_histogram():
+    histogram = DurationHistogram()
+    histogram.add(0.5)
+    histogram.add(2.0)
+    histogram.add(1e-9)
+
+    histogram.remove(2.0)
+    histogram.remove(1e-9)
+
+    expected = DurationHistogram()
+    expected.add(0.5)
+    assert histogram.buckets == expected.buckets
+    assert histogram.zero_count == 0
+    assert histogram.count == 1
+    assert histogram.sum == pytest.approx(0.5)
+
+
+@pytest.mark.parametrize("duration", [3.0, 1e-9])
+def test_remove_rejects_durations_not_added(duration):
+    histogram = DurationHistogram()
+    histogram.add(0.5)
+
+    with pytest.raises(ValueError, match="is not in the histogram"):
+        histogram.remove(duration)
+    assert histogram.count == 1
+
+
+def test_add_rejects_non_positive_count():
+    with pytest.raises(ValueError):
+        DurationHistogram().add(1.0, count=0)
+
+
+def test_dict_round_trip(durations):
+    histogram = DurationHistogram(max_buckets=64)
+    for duration in durations:
+        histogram.add(duration)
+
+    restored = DurationHistogram.from_dict(histogram.to_dict())
+
+    assert restored.buckets == histogram.buckets
+    assert restored.floor == histogram.floor
+    assert restored.quantile(0.99) == histogram.quantile(0.99)
@@ -0,0 +1,81 @@
+import pytest
+
+from pytest_reporter_html.timeline import Timeline
+
+
+@pytest.fixture
+def timeline():
+    """Two workers that start after 2s of collection; gw1 finishes last."""
+    timeline = Timeline(start=100.0, stragglers=2)
+    timeline.add("gw0", "test_a.py::test_one", "setup", 102.0, 102.5, "passed")
+    timeline.add("gw0", "test_a.py::test_one", "call", 102.5, 103.0, "passed")
+    timeline.add("gw0", "test_a.py::test_two", "call", 104.0, 105.0, "failed")
+    timeline.add("gw1", "test_b.py::test_slow", "call", 103.0, 106.0, "passed")
+    timeline.add("gw1", "test_b.py::test_slower", "call", 106.0, 110.0, "passed")
+    timeline.add("gw1", "test_b.py::test_fast", "call", 110.0, 110.5, "passed")
+    return timeline
+
+
+def test_add_returns_session_relative_span(timeline):
+    span = timeline.add("gw0", "test_a.py::test_two", "teardown", 105.0, 105.25, "passed")
+
+    assert span == [0, 5.0, 5.25, 2, 0, "test_a.py::test_two"]
+
+
+def test_summary_excludes_startup_from_idle(timeline):
+    summary = timeline.summary()
+
+    assert summary["startup"] == pytest.approx(2.0)
+    assert summary["end"] == pytest.approx(10.5)
+    assert summary["wall"] == pytest.approx(8.5)
+    assert summary["busy"] == pytest.approx(9.5)
+    assert summary["utilization"] == pytest.approx(9.5 / (8.5 + 7.5))
+
+    gw0, gw1 = summary["workers"]
+    assert gw0["tests"] == 2
+    assert gw0["startup"] == pytest.approx(2.0)
+    assert gw0["busy"] == pytest.approx(2.0)
+    assert gw0["idle"] == pytest.approx(6.5)
+    # Waiting for gw1 to finish is its largest gap, not the startup
+    assert gw0["largest_gap"] == pytest.approx(5.5)
+
+    assert gw1["startup"] == pytest.approx(3.0)
+    assert gw1["busy"] == pytest.approx(7.5)
+    assert gw1["idle"] == pytest.approx(0.0)
+    assert gw1["utilization"] == pytest.approx(1.0)
+    assert gw1["largest_gap"] == pytest.approx(0.0)
+
+
+def test_summary_critical_path(timeline):
+    summary = timeline.summary()
+
+    assert summary["critical_worker"] == "gw1"
+    assert summary["tail"] == pytest.approx(5.5)
+    assert summary["stragglers"] == [
+        {"nodeid": "test_b.py::test_slower", "duration": pytest.approx(4.0)},
+        {"nodeid": "test_b.py::test_slow", "duration": pytest.approx(3.0)}
+    ]
+
+
+def test_summary_counts_overlapping_spans_once():
+    timeline = Timeline(start=0.0)
+    timeline.add("main", "test_a.py::test_one", "call", 1.0, 3.0, "passed")
+    timeline.add("main", "test_a.py::test_two", "call", 2.0, 4.0, "passed")
+
+    worker = timeline.summary()["workers"][0]
+    assert worker["busy"] == pytest.approx(3.0)
+    assert worker["idle"] == pytest.approx(0.0)
+
+
+def test_summary_is_updated_by_new_spans(timeline):
+    assert timeline.summary()["end"] == pytest.approx(10.5)
+
+    timeline.add("gw0", "test_a.py::test_three", "call", 111.0, 112.0, "passed")
+
+    summary = timeline.summary()
+    assert summary["end"] == pytest.approx(12.0)
+    assert summary["critical_worker"] == "gw0"
+
+
+def test_empty_timeline_has_no_summary():
+    assert Timeline().summary() is None